@@ -12,3 +12,8 @@ OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 # Dataset configuration: can be overridden via DATASET_PATH env var
 DEFAULT_DATASET = Path(__file__).parent / "top_100_saas_companies_2025.csv"
 DATASET_PATH = Path(os.getenv("DATASET_PATH", str(DEFAULT_DATASET))).resolve()
+
+# Load-time memory optimization (categoricals, Arrow strings, downcasting).
+OPTIMIZE_MEMORY = os.getenv("OPTIMIZE_MEMORY", "1").lower() not in ("0", "false", "no")
+# Drop raw string columns whose *_num twin parsed every value.
+DROP_PARSED_STRINGS = os.getenv("DROP_PARSED_STRINGS", "0").lower() in ("1", "true", "yes")
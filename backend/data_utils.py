@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import importlib.util
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
-from config import DATASET_PATH
+from config import DATASET_PATH, DROP_PARSED_STRINGS, OPTIMIZE_MEMORY
 
 MONEY_RE = re.compile(r"^\s*\$?\s*([\d,.]+)\s*([KMBT]?)\s*$", re.IGNORECASE)
 
@@ -45,8 +47,10 @@ def _parse_money(value):
 def _enrich_numeric_from_strings(df: pd.DataFrame) -> pd.DataFrame:
     """Add *_num numeric columns for string columns that look numeric or money-like.
 
-    This is dataset-agnostic: it just inspects values.
+    This is dataset-agnostic: it just inspects values. The created twins are
+    recorded in `df.attrs["numeric_twins"]` as {source column: twin column}.
     """
+    twins: Dict[str, str] = {}
     for col in list(df.columns):
         series = df[col]
         if not pd.api.types.is_object_dtype(series):
@@ -66,6 +70,7 @@ def _enrich_numeric_from_strings(df: pd.DataFrame) -> pd.DataFrame:
         if money_ratio >= 0.6:
             full_parsed = series.dropna().astype(str).map(_parse_money)
             df[new_col_name] = full_parsed
+            twins[col] = new_col_name
             continue
 
         # Try plain numeric with commas
@@ -75,19 +80,165 @@ def _enrich_numeric_from_strings(df: pd.DataFrame) -> pd.DataFrame:
         if numeric_ratio >= 0.6:
             full_cleaned = series.dropna().astype(str).str.replace(",", "", regex=False)
             df[new_col_name] = pd.to_numeric(full_cleaned, errors="coerce")
+            twins[col] = new_col_name
 
+    df.attrs["numeric_twins"] = twins
     return df
 
 
-def load_dataset(path: Path | None = None) -> pd.DataFrame:
+def _arrow_strings_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _is_raw_string(series: pd.Series) -> bool:
+    """Return True for plain (object or StringDtype) string columns."""
+    if isinstance(series.dtype, pd.StringDtype):
+        return True
+    return pd.api.types.is_object_dtype(series) and (
+        pd.api.types.infer_dtype(series, skipna=True) == "string"
+    )
+
+
+def _fully_parsed(df: pd.DataFrame, col: str) -> bool:
+    """Return True if every non-null value of `col` parsed into its *_num twin.
+
+    Only twins created by _enrich_numeric_from_strings count, so a *_num column
+    that came with the CSV never causes its namesake to be dropped.
+    """
+    twin = df.attrs.get("numeric_twins", {}).get(col)
+    if twin is None or twin not in df.columns:
+        return False
+    return int(df[twin].notna().sum()) == int(df[col].notna().sum())
+
+
+def _downcast_float(series: pd.Series) -> pd.Series:
+    """Downcast float64 to float32 only if every value round-trips exactly."""
+    if series.dtype != np.float64:
+        return series
+    cast = series.astype(np.float32)
+    back = cast.astype(np.float64)
+    same = (back == series) | (series.isna() & back.isna())
+    return cast if bool(same.all()) else series
+
+
+def optimize_memory(
+    df: pd.DataFrame,
+    max_category_ratio: float = 0.5,
+    drop_parsed_strings: bool = False,
+) -> Tuple[pd.DataFrame, List[Dict]]:
+    """Shrink the in-memory footprint of a loaded dataframe.
+
+    - String columns with few distinct values become categoricals.
+    - Remaining string columns use Arrow-backed strings when pyarrow is installed.
+    - Integers are downcast to the smallest integer dtype; floats go to float32
+      only when every value round-trips, so build_schema still reports the same
+      kinds. This only shrinks storage: the executor widens dtypes back (see
+      executor._widen_dtypes) before running transforms.
+    - With drop_parsed_strings, raw string columns whose *_num twin parsed every
+      value are dropped.
+
+    Returns the optimized dataframe and a per-column report of bytes saved.
+    """
+    use_arrow = _arrow_strings_available()
+    out = df.copy()
+    report: List[Dict] = []
+
+    for col in list(out.columns):
+        series = out[col]
+        before_dtype = str(series.dtype)
+        bytes_before = int(series.memory_usage(index=False, deep=True))
+
+        if (
+            drop_parsed_strings
+            and _is_raw_string(series)
+            and _fully_parsed(out, col)
+        ):
+            out = out.drop(columns=[col])
+            report.append(
+                {
+                    "column": col,
+                    "before_dtype": before_dtype,
+                    "after_dtype": None,
+                    "bytes_before": bytes_before,
+                    "bytes_after": 0,
+                    "bytes_saved": bytes_before,
+                    "dropped": True,
+                }
+            )
+            continue
+
+        if pd.api.types.is_bool_dtype(series):
+            new = series
+        elif pd.api.types.is_integer_dtype(series):
+            new = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            new = _downcast_float(series)
+        elif _is_raw_string(series):
+            non_null = series.dropna()
+            if len(non_null) and non_null.nunique() / len(non_null) <= max_category_ratio:
+                new = series.astype("category")
+            elif use_arrow and not isinstance(series.dtype, pd.StringDtype):
+                new = series.astype(pd.StringDtype("pyarrow"))
+            else:
+                new = series
+        else:
+            new = series
+
+        bytes_after = int(new.memory_usage(index=False, deep=True))
+        if bytes_after >= bytes_before:
+            # Not worth it (e.g. categorical over very short strings).
+            new, bytes_after = series, bytes_before
+        out[col] = new
+        report.append(
+            {
+                "column": col,
+                "before_dtype": before_dtype,
+                "after_dtype": str(new.dtype),
+                "bytes_before": bytes_before,
+                "bytes_after": bytes_after,
+                "bytes_saved": bytes_before - bytes_after,
+                "dropped": False,
+            }
+        )
+
+    return out, report
+
+
+def load_dataset(
+    path: Path | None = None,
+    optimize: bool | None = None,
+    drop_parsed_strings: bool | None = None,
+) -> Tuple[pd.DataFrame, List[Dict]]:
     """Load the CSV dataset and enrich it with generic numeric columns.
 
-    The function is general and works for any CSV file.
+    The function is general and works for any CSV file. When `optimize` is
+    enabled (default from OPTIMIZE_MEMORY), the frame goes through
+    optimize_memory. Returns the dataframe and the memory report (empty when
+    not optimized).
     """
     csv_path = path or DATASET_PATH
     df = pd.read_csv(csv_path)
     df = _enrich_numeric_from_strings(df)
-    return df
+
+    if optimize is None:
+        optimize = OPTIMIZE_MEMORY
+    if drop_parsed_strings is None:
+        drop_parsed_strings = DROP_PARSED_STRINGS
+    report: List[Dict] = []
+    if optimize:
+        df, report = optimize_memory(df, drop_parsed_strings=drop_parsed_strings)
+    return df, report
+
+
+def summarize_memory_report(report: List[Dict], top_n: int = 3) -> str:
+    """Summarize an optimize_memory report in one line for logging."""
+    before = sum(entry["bytes_before"] for entry in report)
+    after = sum(entry["bytes_after"] for entry in report)
+    top = sorted(report, key=lambda entry: entry["bytes_saved"], reverse=True)[:top_n]
+    top_str = ", ".join(
+        f"{entry['column']} -{entry['bytes_saved']}" for entry in top if entry["bytes_saved"] > 0
+    )
+    return f"dataset memory: {before} -> {after} bytes; top savings: {top_str or 'none'}"
 
 
 def build_schema(df: pd.DataFrame) -> List[Dict]:
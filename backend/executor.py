@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import math
 
 import pandas as pd
@@ -8,13 +8,68 @@ import pandas as pd
 from models import LLMPlan, Transform
 
 
-def apply_transforms(df: pd.DataFrame, transforms: List[Transform]) -> pd.DataFrame:
+def _referenced_columns(df: pd.DataFrame, transforms: List[Transform]) -> List[str]:
+    """Return the dataframe columns the transforms read from.
+
+    Columns in a filter expression are matched by name, which may over-include
+    but never misses one.
+    """
+    names = set()
+    for t in transforms or []:
+        names.update(t.by or [])
+        names.update(agg.column for agg in t.aggregations or [])
+        if t.column:
+            names.add(t.column)
+        if t.filter_expr:
+            names.update(c for c in df.columns if str(c) in t.filter_expr)
+    return [c for c in df.columns if c in names]
+
+
+def _widen_dtypes(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Undo load-time storage optimizations for `columns` on a working copy.
+
+    Downcast integers/floats are widened so arithmetic and aggregations don't
+    overflow or lose precision, and categoricals go back to plain strings so
+    filters keep lexical comparison semantics. Other columns keep their
+    compact dtypes.
+    """
+    out = df.copy()
+    for col in columns:
+        series = out[col]
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            out[col] = series.astype(series.cat.categories.dtype)
+        elif pd.api.types.is_bool_dtype(dtype):
+            continue
+        elif pd.api.types.is_extension_array_dtype(dtype):
+            # Nullable dtypes may hold pd.NA, so stay nullable.
+            if pd.api.types.is_integer_dtype(dtype) and dtype != "Int64":
+                out[col] = series.astype("Int64")
+            elif pd.api.types.is_float_dtype(dtype) and dtype != "Float64":
+                out[col] = series.astype("Float64")
+        elif pd.api.types.is_unsigned_integer_dtype(dtype) and dtype != "uint64":
+            out[col] = series.astype("uint64")
+        elif pd.api.types.is_signed_integer_dtype(dtype) and dtype != "int64":
+            out[col] = series.astype("int64")
+        elif pd.api.types.is_float_dtype(dtype) and dtype != "float64":
+            out[col] = series.astype("float64")
+    return out
+
+
+def apply_transforms(
+    df: pd.DataFrame,
+    transforms: List[Transform],
+    extra_columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """Apply a sequence of generic transforms to the dataframe.
 
     All operations are dataset-agnostic: they depend only on the column names
-    referenced in the transform objects.
+    referenced in the transform objects. Those columns, plus `extra_columns`
+    (e.g. chart encodings), are widened back from their load-time dtypes.
     """
-    out = df.copy()
+    columns = _referenced_columns(df, transforms)
+    columns += [c for c in extra_columns or [] if c in df.columns and c not in columns]
+    out = _widen_dtypes(df, columns)
     for t in transforms or []:
         if t.op == "groupby":
             group_cols = t.by or []
@@ -25,7 +80,9 @@ def apply_transforms(df: pd.DataFrame, transforms: List[Transform]) -> pd.DataFr
                 out = out.groupby(group_cols).agg(**agg_dict).reset_index()
 
         elif t.op == "sort" and t.by:
-            out = out.sort_values(by=t.by, ascending=(t.order != "desc"))
+            out = out.sort_values(
+                by=t.by, ascending=(t.order != "desc"), kind="stable"
+            )
 
         elif t.op == "select" and t.columns:
             cols = [c for c in t.columns if c in out.columns]
@@ -55,6 +112,8 @@ def apply_transforms(df: pd.DataFrame, transforms: List[Transform]) -> pd.DataFr
 
 
 def _make_json_safe(obj):
+    if obj is pd.NA:
+        return None
     if isinstance(obj, float):
         return obj if math.isfinite(obj) else None
     if isinstance(obj, dict):
@@ -70,9 +129,12 @@ def execute_plan(df: pd.DataFrame, plan: LLMPlan) -> Dict[str, Any]:
     Returns a JSON-serializable payload for the frontend.
     """
     chart = plan.chart
-    transformed = apply_transforms(df, chart.transforms or [])
-
     enc = chart.encoding
+    transformed = apply_transforms(
+        df,
+        chart.transforms or [],
+        extra_columns=[enc.x, enc.y, enc.label, enc.value],
+    )
 
     # Basic validation by viz type
     errors: List[str] = []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import uuid
 from typing import Any, Dict, Optional, List
 
@@ -7,7 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from data_utils import load_dataset, build_schema
+from data_utils import load_dataset, build_schema, summarize_memory_report
 from executor import execute_plan
 from llm_planner import build_plan_from_prompt
 
@@ -22,9 +23,14 @@ app.add_middleware(
 )
 
 # Load data & schema at startup (for this example, single CSV).
-df = load_dataset()
+df, memory_report = load_dataset()
 schema = build_schema(df)
 
+# uvicorn's error logger is the one it prints at INFO level by default.
+logger = logging.getLogger("uvicorn.error")
+if memory_report:
+    logger.info(summarize_memory_report(memory_report))
+
 
 class VizRequest(BaseModel):
     prompt: str
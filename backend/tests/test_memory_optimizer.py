@@ -0,0 +1,175 @@
+import pandas as pd
+import pandas.testing as pdt
+
+from data_utils import (
+    _enrich_numeric_from_strings,
+    build_schema,
+    load_dataset,
+    optimize_memory,
+    summarize_memory_report,
+)
+from executor import _widen_dtypes, apply_transforms
+from models import Transform
+
+
+def _kinds(df):
+    return {entry["name"]: entry["kind"] for entry in build_schema(df)}
+
+
+def _groupby(by, column, agg):
+    return Transform(
+        op="groupby",
+        by=[by],
+        aggregations=[{"column": column, "agg": agg, "new_column": "value"}],
+    )
+
+
+def test_schema_kinds_unchanged_on_dataset():
+    raw, raw_report = load_dataset(optimize=False)
+    optimized, report = load_dataset(optimize=True)
+    assert build_schema(optimized) == build_schema(raw)
+    assert raw_report == []
+    assert {entry["column"] for entry in report} == set(raw.columns)
+    assert "memory_report" not in optimized.attrs
+
+
+def test_report_contents():
+    df = pd.DataFrame(
+        {
+            "small": [1, 2, 3, 4],
+            "rating": [1.5, 2.5, 3.5, 4.5],
+            "label": ["a", "a", "a", "b"],
+        }
+    )
+    optimized, report = optimize_memory(df)
+    by_col = {entry["column"]: entry for entry in report}
+
+    assert set(by_col) == {"small", "rating", "label"}
+    assert by_col["small"]["before_dtype"] == "int64"
+    assert by_col["small"]["after_dtype"] == "int8"
+    assert by_col["rating"]["after_dtype"] == "float32"
+    assert by_col["label"]["after_dtype"] == "category"
+    for col, entry in by_col.items():
+        assert entry["bytes_before"] == df[col].memory_usage(index=False, deep=True)
+        assert entry["bytes_after"] == optimized[col].memory_usage(index=False, deep=True)
+        assert entry["bytes_saved"] == entry["bytes_before"] - entry["bytes_after"]
+        assert entry["bytes_saved"] > 0
+        assert entry["dropped"] is False
+
+
+def test_drop_parsed_strings():
+    df = _enrich_numeric_from_strings(
+        pd.DataFrame({"arr": ["$1M", "$2B", None], "note": ["x", "y", "z"]})
+    )
+    optimized, report = optimize_memory(df, drop_parsed_strings=True)
+
+    assert "arr" not in optimized.columns
+    assert "arr_num" in optimized.columns
+    dropped = [entry for entry in report if entry["dropped"]]
+    assert [entry["column"] for entry in dropped] == ["arr"]
+    assert dropped[0]["bytes_after"] == 0
+    assert dropped[0]["after_dtype"] is None
+
+
+def test_drop_ignores_preexisting_num_columns():
+    df = pd.DataFrame({"foo": ["a", "b"], "foo_num": [1.0, 2.0]})
+    optimized, _ = optimize_memory(df, drop_parsed_strings=True)
+    assert "foo" in optimized.columns
+
+
+def test_integer_arithmetic_does_not_overflow():
+    df = pd.DataFrame({"r": [1, 2, 3, 4, 5]})
+    optimized, _ = optimize_memory(df)
+    assert optimized["r"].dtype == "int8"
+
+    transforms = [Transform(op="filter", filter_expr="r * 100 > 150")]
+    result = apply_transforms(optimized, transforms)
+    assert result["r"].tolist() == [2, 3, 4, 5]
+    pdt.assert_frame_equal(result, apply_transforms(df, transforms))
+
+
+def test_float_aggregation_keeps_precision():
+    df = pd.DataFrame({"g": ["a"] * 20, "x": [16777216.0] * 10 + [1.0] * 10})
+    optimized, _ = optimize_memory(df)
+    assert optimized["x"].dtype == "float32"
+
+    transforms = [_groupby("g", "x", "sum")]
+    result = apply_transforms(optimized, transforms)
+    assert result["value"].tolist() == [167772170.0]
+    pdt.assert_frame_equal(result, apply_transforms(df, transforms))
+
+
+def test_categorical_filter_keeps_lexical_comparison():
+    raw, _ = load_dataset(optimize=False)
+    optimized, _ = load_dataset(optimize=True)
+    assert isinstance(optimized["HQ"].dtype, pd.CategoricalDtype)
+
+    transforms = [Transform(op="filter", filter_expr='HQ > "M"')]
+    expected = apply_transforms(raw, transforms)
+    result = apply_transforms(optimized, transforms)
+    assert 0 < len(result) < len(raw)
+    assert result.index.tolist() == expected.index.tolist()
+
+
+def test_groupby_matches_unoptimized_dataset():
+    raw, _ = load_dataset(optimize=False)
+    optimized, _ = load_dataset(optimize=True)
+    for by in ("HQ", "Industry"):
+        for agg in ("sum", "mean", "count"):
+            transforms = [_groupby(by, "Employees_num", agg)]
+            expected = apply_transforms(raw, transforms)
+            result = apply_transforms(optimized, transforms)
+            pdt.assert_frame_equal(result, expected, check_dtype=False)
+            assert result["value"].dtype == expected["value"].dtype
+
+
+def test_sort_matches_unoptimized_dataset():
+    raw, _ = load_dataset(optimize=False)
+    optimized, _ = load_dataset(optimize=True)
+    for by in (["Industry"], ["HQ"], ["Founded Year"]):
+        for order in ("asc", "desc"):
+            transforms = [Transform(op="sort", by=by, order=order)]
+            expected = apply_transforms(raw, transforms)
+            result = apply_transforms(optimized, transforms)
+            assert result.index.tolist() == expected.index.tolist()
+
+
+def test_nullable_and_unsigned_ints_are_widened_safely():
+    df = pd.DataFrame(
+        {
+            "nullable": pd.array([1, None, 3], dtype="Int8"),
+            "big": pd.Series([2**63, 1, 2], dtype="uint64"),
+            "small_unsigned": pd.Series([1, 2, 3], dtype="uint8"),
+        }
+    )
+    optimized, _ = optimize_memory(df)
+    widened = _widen_dtypes(optimized, list(optimized.columns))
+
+    assert widened["nullable"].dtype == "Int64"
+    assert widened["nullable"].isna().tolist() == [False, True, False]
+    assert widened["big"].dtype == "uint64"
+    assert widened["big"].tolist() == [2**63, 1, 2]
+    assert widened["small_unsigned"].dtype == "uint64"
+    pdt.assert_frame_equal(apply_transforms(optimized, []), optimized)
+
+
+def test_only_referenced_columns_are_widened():
+    optimized, _ = load_dataset(optimize=True)
+    assert isinstance(optimized["HQ"].dtype, pd.CategoricalDtype)
+
+    result = apply_transforms(
+        optimized, [Transform(op="filter", filter_expr="`Founded Year` > 2000")]
+    )
+    assert result["Founded Year"].dtype == "int64"
+    assert isinstance(result["HQ"].dtype, pd.CategoricalDtype)
+
+
+def test_summarize_memory_report():
+    report = [
+        {"column": "a", "bytes_before": 100, "bytes_after": 40, "bytes_saved": 60},
+        {"column": "b", "bytes_before": 50, "bytes_after": 50, "bytes_saved": 0},
+        {"column": "c", "bytes_before": 30, "bytes_after": 0, "bytes_saved": 30},
+    ]
+    assert summarize_memory_report(report) == (
+        "dataset memory: 180 -> 90 bytes; top savings: a -60, c -30"
+    )